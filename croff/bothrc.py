@@ -16,9 +16,15 @@ Author: Converted from bash script
 License: Compatible with original troff licensing
 """
 
+import functools
 import os
+import shutil
+import stat
 import subprocess
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Optional, Tuple
 
@@ -29,6 +35,37 @@ class AssemblyBuildError(Exception):
     pass
 
 
+def _rm_f(path: str) -> bool:
+    """
+    Remove a file if present in a single syscall.
+
+    Args:
+        path: Path of the file to remove.
+
+    Returns:
+        True if a file was removed, False if it did not exist.
+    """
+    try:
+        os.unlink(path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+@functools.lru_cache(maxsize=16)
+def _resolve_tool(tool: str) -> Optional[str]:
+    """
+    Resolve a tool name to its absolute path once per process.
+
+    Args:
+        tool: Name of the command-line tool to resolve.
+
+    Returns:
+        Absolute path of the tool, or None if it is not on PATH.
+    """
+    return shutil.which(tool)
+
+
 class TroffBuilder:
     """
     A robust builder for troff assembly components.
@@ -47,7 +84,20 @@ class TroffBuilder:
         """
         self.working_dir = Path(working_directory) if working_directory else Path.cwd()
         self.assembler_command = "as"
-        self.temp_output = "a.out"
+
+        # Precomputed string form of the working directory so per-file
+        # joins below avoid allocating fresh Path objects.
+        self._working_dir_str = str(self.working_dir)
+
+        # Resolve the assembler once so later spawns skip the PATH walk
+        # and can use the posix_spawn fast path (close_fds=False below
+        # keeps Python on that path; requires Python 3.11+).
+        self._assembler_abs = _resolve_tool(self.assembler_command)
+        if self._assembler_abs is None:
+            raise AssemblyBuildError(
+                f"Assembler '{self.assembler_command}' not found in PATH. "
+                "Please ensure it's installed."
+            )
 
         # Validate working directory
         if not self.working_dir.exists():
@@ -56,37 +106,7 @@ class TroffBuilder:
         if not self.working_dir.is_dir():
             raise AssemblyBuildError(f"Working directory is not a directory: {self.working_dir}")
 
-    def _validate_assembler(self) -> None:
-        """
-        Validate that the assembler is available in the system PATH.
-
-        Raises:
-            AssemblyBuildError: If assembler is not found or not executable.
-        """
-        try:
-            result = subprocess.run(
-                [self.assembler_command, "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                cwd=self.working_dir
-            )
-            if result.returncode != 0:
-                # Some assemblers don't support --version, try --help
-                result = subprocess.run(
-                    [self.assembler_command, "--help"],
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                    cwd=self.working_dir
-                )
-        except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-            raise AssemblyBuildError(
-                f"Assembler '{self.assembler_command}' not found or not working. "
-                f"Please ensure it's installed and in PATH. Error: {e}"
-            ) from e
-
-    def _validate_source_file(self, source_file: Path) -> None:
+    def _validate_source_file(self, source_file: str) -> None:
         """
         Validate that a source file exists and is readable.
 
@@ -96,29 +116,22 @@ class TroffBuilder:
         Raises:
             AssemblyBuildError: If file doesn't exist, isn't readable, or is empty.
         """
-        if not source_file.exists():
+        # One os.stat answers existence, file type, and size together
+        try:
+            file_stat = os.stat(source_file)
+        except FileNotFoundError:
             raise AssemblyBuildError(f"Source file not found: {source_file}")
 
-        if not source_file.is_file():
+        if not stat.S_ISREG(file_stat.st_mode):
             raise AssemblyBuildError(f"Source path is not a file: {source_file}")
 
         if not os.access(source_file, os.R_OK):
             raise AssemblyBuildError(f"Source file is not readable: {source_file}")
 
         # Check if file is empty
-        if source_file.stat().st_size == 0:
+        if file_stat.st_size == 0:
             raise AssemblyBuildError(f"Source file is empty: {source_file}")
 
-    def _clean_temp_files(self) -> None:
-        """Remove temporary output files from previous builds."""
-        temp_file = self.working_dir / self.temp_output
-        if temp_file.exists():
-            try:
-                temp_file.unlink()
-                print(f"Cleaned temporary file: {temp_file}")
-            except OSError as e:
-                print(f"Warning: Could not remove temporary file {temp_file}: {e}")
-
     def assemble_file(self, source_file: str, output_file: str) -> bool:
         """
         Assemble a single source file into an object file.
@@ -133,26 +146,29 @@ class TroffBuilder:
         Raises:
             AssemblyBuildError: If assembly fails or files cannot be processed.
         """
-        source_path = self.working_dir / source_file
-        output_path = self.working_dir / output_file
-        temp_path = self.working_dir / self.temp_output
+        source_path = os.path.join(self._working_dir_str, source_file)
+        output_path = os.path.join(self._working_dir_str, output_file)
 
         # Validate source file
         self._validate_source_file(source_path)
 
-        # Clean any existing temporary output
-        self._clean_temp_files()
-
-        print(f"Assembling {source_file}...")
+        # Assemble into a unique temporary file so independent targets can
+        # run in parallel without racing on a shared a.out.
+        temp_fd, temp_name = tempfile.mkstemp(
+            dir=self.working_dir, prefix=f".{output_file}.", suffix=".tmp"
+        )
+        os.close(temp_fd)
 
         try:
             # Run the assembler
             result = subprocess.run(
-                [self.assembler_command, str(source_path)],
+                [self.assembler_command, "-o", temp_name, source_path],
                 capture_output=True,
                 text=True,
                 timeout=60,  # 60 second timeout for assembly
-                cwd=self.working_dir
+                cwd=self.working_dir,
+                close_fds=False,
+                executable=self._assembler_abs,
             )
 
             if result.returncode != 0:
@@ -163,35 +179,51 @@ class TroffBuilder:
                 )
                 raise AssemblyBuildError(error_msg)
 
-            # Check if assembler created the expected output
-            if not temp_path.exists():
+            # Verify the assembler produced real output before publishing it
+            if os.stat(temp_name).st_size == 0:
                 raise AssemblyBuildError(
-                    f"Assembler did not create expected output file: {temp_path}"
+                    f"Output file {output_file} was not created properly"
                 )
 
-            # Move temporary output to final location
+            # Atomically move the temporary output to its final location
             try:
-                if output_path.exists():
-                    output_path.unlink()  # Remove existing output file
-
-                temp_path.rename(output_path)
-                print(f"Created {output_file}")
-
-                # Verify the output file was created successfully
-                if not output_path.exists() or output_path.stat().st_size == 0:
-                    raise AssemblyBuildError(f"Output file {output_file} was not created properly")
-
-                return True
-
+                os.replace(temp_name, output_path)
             except OSError as e:
                 raise AssemblyBuildError(
-                    f"Failed to rename {self.temp_output} to {output_file}: {e}"
+                    f"Failed to rename temporary output to {output_file}: {e}"
                 ) from e
 
+            return True
+
         except subprocess.TimeoutExpired as e:
             raise AssemblyBuildError(f"Assembly of {source_file} timed out") from e
         except subprocess.SubprocessError as e:
             raise AssemblyBuildError(f"Subprocess error during assembly of {source_file}: {e}") from e
+        finally:
+            # Drop the temporary file if it was not renamed into place
+            _rm_f(temp_name)
+
+    def _needs_rebuild(self, source_file: str, output_file: str) -> bool:
+        """
+        Check whether an object file must be rebuilt from its source.
+
+        Args:
+            source_file: Name of the assembly source file.
+            output_file: Name of the object file built from it.
+
+        Returns:
+            bool: True if the object is missing or older than the source.
+        """
+        try:
+            output_mtime = os.stat(
+                os.path.join(self._working_dir_str, output_file)
+            ).st_mtime
+            source_mtime = os.stat(
+                os.path.join(self._working_dir_str, source_file)
+            ).st_mtime
+        except FileNotFoundError:
+            return True
+        return output_mtime < source_mtime
 
     def clean_output_files(self, output_files: List[str]) -> None:
         """
@@ -200,15 +232,16 @@ class TroffBuilder:
         Args:
             output_files: List of output file names to clean.
         """
-        print("Cleaning existing output files...")
+        removed = []
         for output_file in output_files:
-            output_path = self.working_dir / output_file
-            if output_path.exists():
-                try:
-                    output_path.unlink()
-                    print(f"Removed existing {output_file}")
-                except OSError as e:
-                    print(f"Warning: Could not remove {output_file}: {e}")
+            output_path = os.path.join(self._working_dir_str, output_file)
+            try:
+                if _rm_f(output_path):
+                    removed.append(output_file)
+            except OSError as e:
+                print(f"Warning: Could not remove {output_file}: {e}")
+        if removed:
+            print(f"Removed existing output files: {', '.join(removed)}")
 
     def build_all(self) -> Tuple[bool, List[str]]:
         """
@@ -226,30 +259,38 @@ class TroffBuilder:
             ("hytab.s", "hytab.o"),
         ]
 
-        output_files = [target[1] for target in build_targets]
         created_files: List[str] = []
 
-        try:
-            # Validate environment
-            self._validate_assembler()
+        # Skip targets whose object file is already newer than its source
+        build_targets = [
+            target for target in build_targets if self._needs_rebuild(*target)
+        ]
+        if not build_targets:
+            print("All objects up to date")
+            return True, created_files
 
-            # Clean existing output files
-            self.clean_output_files(output_files)
+        output_files = [target[1] for target in build_targets]
 
-            # Build each target
-            for source_file, output_file in build_targets:
-                if self.assemble_file(source_file, output_file):
-                    created_files.append(output_file)
+        # Clean existing output files
+        self.clean_output_files(output_files)
+
+        # Assemble the independent targets in parallel; the waits are
+        # kernel-bound, so threads are sufficient here.
+        start_time = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(build_targets)) as executor:
+            futures = {
+                executor.submit(self.assemble_file, source_file, output_file): output_file
+                for source_file, output_file in build_targets
+            }
+            for future in as_completed(futures):
+                if future.result():
+                    created_files.append(futures[future])
                 else:
                     return False, created_files
 
-            print("Build completed successfully")
-            return True, created_files
-
-        except AssemblyBuildError:
-            # Clean up any partial builds on failure
-            self._clean_temp_files()
-            raise
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        print(f"Assembled {len(created_files)} objects in {elapsed_ms:.0f}ms")
+        return True, created_files
 
 
 def main() -> int:
@@ -267,7 +308,8 @@ def main() -> int:
         success, created_files = builder.build_all()
 
         if success:
-            print(f"\nSuccessfully created files: {', '.join(created_files)}")
+            if created_files:
+                print(f"\nSuccessfully created files: {', '.join(created_files)}")
             return 0
         else:
             print("\nBuild failed")
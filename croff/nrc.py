@@ -22,14 +22,128 @@ Features:
 """
 
 import argparse
+import functools
 import logging
+import multiprocessing
 import os
+import shutil
 import subprocess
 import sys
+import time
 from pathlib import Path
 from typing import List, Optional, Tuple
 
 
+@functools.lru_cache(maxsize=16)
+def _resolve_tool(tool: str) -> Optional[str]:
+    """
+    Resolve a tool name to its absolute path once per process.
+
+    Args:
+        tool: Name of the command-line tool to resolve.
+
+    Returns:
+        Absolute path of the tool, or None if it is not on PATH.
+    """
+    return shutil.which(tool)
+
+
+@functools.lru_cache(maxsize=16)
+def _probe_tool(tool: str) -> Tuple[int, str]:
+    """
+    Run ``tool --version`` once per process and cache the result.
+
+    Args:
+        tool: Name of the command-line tool to probe.
+
+    Returns:
+        Tuple of (return code, first line of version output). The return
+        code is -1 if the tool could not be spawned at all.
+    """
+    try:
+        result = subprocess.run(
+            [tool, "--version"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+            close_fds=False,
+        )
+        version_line = (result.stdout or "").strip().split("\n")[0]
+        return result.returncode, version_line
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return -1, ""
+
+
+def _peek(path: str, n: int = 128) -> Optional[bytes]:
+    """
+    Read the first bytes of a file with raw os-level I/O.
+
+    Two syscalls (open + pread) and no codec, versus the three syscalls
+    and UTF-8 decode of a buffered text open.
+
+    Args:
+        path: Path of the file to read.
+        n: Maximum number of bytes to read.
+
+    Returns:
+        The leading bytes of the file, or None if it cannot be read.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        return os.pread(fd, n, 0)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+
+def _rm_f(path: str) -> bool:
+    """
+    Remove a file if present in a single syscall.
+
+    Args:
+        path: Path of the file to remove.
+
+    Returns:
+        True if a file was removed, False if it did not exist.
+    """
+    try:
+        os.unlink(path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def _compile_translation_unit(job: Tuple[List[str], str]) -> Tuple[str, int, str]:
+    """
+    Compile a single translation unit in a worker process.
+
+    This is a module-level function so it can be pickled and dispatched
+    through a multiprocessing pool.
+
+    Args:
+        job: Tuple of (compile command, working directory)
+
+    Returns:
+        Tuple of (source file name, return code, combined output)
+    """
+    command, cwd = job
+    try:
+        result = subprocess.run(
+            command,
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            close_fds=False,
+        )
+        return command[-3], result.returncode, (result.stdout or "") + (result.stderr or "")
+    except FileNotFoundError:
+        return command[-3], 127, f"Command not found: {command[0]}"
+
+
 class NroffBuilder:
     """
     Builder class for NROFF text formatter.
@@ -77,7 +191,25 @@ class NroffBuilder:
         # Additional build configurations
         self.backup_existing = True
         self.validate_sources = True
-    
+
+        # Number of parallel compile jobs (overridable via --jobs or the
+        # NROFF_NUM_BUILD_JOBS environment variable)
+        self.jobs = int(
+            os.environ.get("NROFF_NUM_BUILD_JOBS", os.cpu_count() or 1)
+        )
+
+        # Precomputed string paths; Path.__truediv__ allocates a fresh
+        # object per join, so the hot paths below work on plain strings.
+        build_dir_str = str(self.build_dir)
+        self._src_paths = [
+            os.path.join(build_dir_str, name) for name in self.source_files
+        ]
+        self._obj_paths = [
+            os.path.join(build_dir_str, name) for name in self.object_files
+        ]
+        self._exe_path = os.path.join(build_dir_str, self.output_executable)
+        self._tu_obj_paths = [p[:-2] + ".o" for p in self._src_paths]
+
     def _setup_logging(self) -> logging.Logger:
         """
         Set up logging configuration.
@@ -89,12 +221,22 @@ class NroffBuilder:
         logger.setLevel(logging.DEBUG if self.verbose else logging.INFO)
 
         if not logger.handlers:
-            handler = logging.StreamHandler(sys.stdout)
-            formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+            # Large write buffer so the handler issues few syscalls; the
+            # record format skips asctime, which would cost a strftime per
+            # record.
+            stream = os.fdopen(
+                sys.stdout.fileno(), "w", buffering=65536, closefd=False
             )
+            handler = logging.StreamHandler(stream)
+            if self.verbose:
+                formatter = logging.Formatter(
+                    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+                )
+            else:
+                formatter = logging.Formatter("%(levelname)s %(message)s")
             handler.setFormatter(formatter)
             logger.addHandler(handler)
+            logger.propagate = False
 
         return logger
     
@@ -109,41 +251,50 @@ class NroffBuilder:
 
         missing_files = []
 
+        # One readdir supplies cached stat data for every expected file,
+        # instead of one lookup syscall per source and object file
+        try:
+            with os.scandir(self.build_dir) as it:
+                entries = {entry.name: entry for entry in it}
+        except FileNotFoundError:
+            self.logger.error(f"Build directory not found: {self.build_dir}")
+            return False
+
         # Check source files
-        for source_file in self.source_files:
-            file_path = self.build_dir / source_file
-            if not file_path.exists():
-                missing_files.append(str(file_path))
-            elif self.validate_sources:
-                # Basic validation: check if file is not empty and appears to be C code
-                try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        content = f.read(100)  # Read first 100 chars
-                        if not content.strip():
-                            self.logger.warning(
-                                f"Source file {source_file} appears to be empty"
-                            )
-                        elif not (
-                            "#include" in content
-                            or "int " in content
-                            or "char " in content
-                        ):
-                            self.logger.warning(
-                                f"Source file {source_file} may not be valid C code"
-                            )
-                except (UnicodeDecodeError, IOError) as e:
+        for source_file, file_path in zip(self.source_files, self._src_paths):
+            if source_file not in entries:
+                missing_files.append(file_path)
+                continue
+            if self.validate_sources:
+                # Basic validation: sniff the first bytes to check the file
+                # is not empty and appears to be C code
+                head = _peek(file_path)
+                if head is None:
                     self.logger.warning(
-                        f"Could not validate source file {source_file}: {e}"
+                        f"Could not validate source file {source_file}"
+                    )
+                elif not head.strip():
+                    self.logger.warning(
+                        f"Source file {source_file} appears to be empty"
+                    )
+                elif not (
+                    b"#include" in head
+                    or b"int " in head
+                    or b"char " in head
+                ):
+                    self.logger.warning(
+                        f"Source file {source_file} may not be valid C code"
                     )
 
         # Check object files
-        for object_file in self.object_files:
-            file_path = self.build_dir / object_file
-            if not file_path.exists():
-                missing_files.append(str(file_path))
+        for object_file, file_path in zip(self.object_files, self._obj_paths):
+            entry = entries.get(object_file)
+            if entry is None:
+                missing_files.append(file_path)
             else:
                 # Basic validation: check if object file has reasonable size
-                file_size = file_path.stat().st_size
+                # (DirEntry.stat is served from the scandir cache)
+                file_size = entry.stat().st_size
                 if file_size == 0:
                     self.logger.warning(f"Object file {object_file} is empty")
                 elif file_size < 50:  # Very small for an object file
@@ -161,71 +312,212 @@ class NroffBuilder:
         self.logger.info("All dependencies found.")
         return True
     
+    def _spawn(
+        self, command: List[str], capture_stdout: bool
+    ) -> Tuple[int, str, str]:
+        """
+        Spawn a command through Popen with explicit pipes.
+
+        Constructing Popen directly skips the convenience layers of
+        subprocess.run on the hot compile/link spawns.
+
+        Args:
+            command: Command and arguments to execute
+            capture_stdout: Whether to capture stdout (discarded otherwise)
+
+        Returns:
+            Tuple of (return code, stdout output, stderr output)
+        """
+        # close_fds=False keeps subprocess on the posix_spawn fast
+        # path (Python 3.11+), avoiding a full fork of the parent.
+        process = subprocess.Popen(
+            command,
+            cwd=self.build_dir,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            close_fds=False,
+        )
+        stdout, stderr = process.communicate()
+        return process.returncode, stdout or "", stderr or ""
+
     def run_command(self, command: List[str], description: str) -> Tuple[bool, str]:
         """
         Execute a shell command with error handling.
-        
+
         Args:
             command: Command and arguments to execute
             description: Human-readable description of the command
-            
+
         Returns:
             Tuple of (success_flag, output_message)
         """
-        self.logger.info(f"{description}...")
-        self.logger.debug(f"Executing: {' '.join(command)}")
-        
+        # Lazy %-style formatting so the strings are never built when
+        # DEBUG is disabled (the default)
+        self.logger.debug("%s...", description)
+        self.logger.debug("Executing: %s", " ".join(command))
+
+        # Only capture stdout when it will actually be logged; stderr is
+        # always captured so failures can be reported.
+        capture_stdout = self.logger.isEnabledFor(logging.DEBUG)
+
         try:
-            result = subprocess.run(
-                command,
-                cwd=self.build_dir,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            if result.stdout:
-                self.logger.debug(f"stdout: {result.stdout}")
-            if result.stderr:
-                self.logger.debug(f"stderr: {result.stderr}")
-            
-            self.logger.info(f"{description} completed successfully.")
-            return True, result.stdout
-            
-        except subprocess.CalledProcessError as e:
-            error_msg = f"{description} failed with exit code {e.returncode}"
-            if e.stderr:
-                error_msg += f"\nError output: {e.stderr}"
-            self.logger.error(error_msg)
-            return False, error_msg
-        
+            returncode, stdout, stderr = self._spawn(command, capture_stdout)
         except FileNotFoundError:
             error_msg = f"Command not found: {command[0]}"
             self.logger.error(error_msg)
             return False, error_msg
-    
+
+        if stdout:
+            self.logger.debug("stdout: %s", stdout)
+        if stderr:
+            self.logger.debug("stderr: %s", stderr)
+
+        if returncode != 0:
+            error_msg = f"{description} failed with exit code {returncode}"
+            if stderr:
+                error_msg += f"\nError output: {stderr}"
+            self.logger.error(error_msg)
+            return False, error_msg
+
+        self.logger.debug("%s completed successfully.", description)
+        return True, stdout
+
     def compile_and_link(self) -> bool:
         """
-        Compile source files and link with object files.
-        
+        Compile source files in parallel and link with object files.
+
+        Each translation unit is compiled to its own object file through a
+        multiprocessing pool (the source files are independent), then a
+        single link step combines them with the pre-built object files.
+
         Returns:
             True if compilation and linking succeed, False otherwise
         """
-        # Construct compilation command
-        compile_command = [self.compiler] + self.compile_flags
-        
-        # Add source files
-        compile_command.extend(self.source_files)
-        
-        # Add object files
-        compile_command.extend(self.object_files)
-        
-        # Execute compilation
-        success, output = self.run_command(
-            compile_command,
-            "Compiling and linking NROFF"
+        # Resolve the compiler once so each spawn skips the PATH walk
+        compiler = _resolve_tool(self.compiler) or self.compiler
+
+        # Phase 1: compile each translation unit whose object file is
+        # missing or older than its source or any shared header
+        # (make-style incremental build)
+        header_mtime = self._newest_header_mtime()
+        jobs = []
+        for source_file, source_path, object_path in zip(
+            self.source_files, self._src_paths, self._tu_obj_paths
+        ):
+            if self._is_up_to_date(object_path, source_path, header_mtime):
+                continue
+            object_file = source_file.replace(".c", ".o")
+            command = (
+                [compiler]
+                + self.compile_flags
+                + ["-c", source_file, "-o", object_file]
+            )
+            jobs.append((command, str(self.build_dir)))
+
+        if not jobs:
+            self.logger.info("All object files up to date; skipping compile")
+            return self._link()
+
+        worker_count = max(1, min(self.jobs, len(jobs)))
+        self.logger.debug(
+            f"Compiling {len(jobs)} translation units "
+            f"({worker_count} parallel jobs)..."
         )
-        
+        start_time = time.perf_counter()
+
+        if worker_count > 1:
+            with multiprocessing.Pool(worker_count) as pool:
+                results = pool.map(_compile_translation_unit, jobs)
+        else:
+            results = [_compile_translation_unit(job) for job in jobs]
+
+        failed = False
+        for source_file, returncode, output in results:
+            if returncode != 0:
+                self.logger.error(
+                    f"Compilation of {source_file} failed "
+                    f"with exit code {returncode}"
+                )
+                if output:
+                    self.logger.error(f"Error output: {output}")
+                failed = True
+            elif output:
+                self.logger.debug("%s: %s", source_file, output)
+
+        if failed:
+            return False
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        self.logger.info(
+            f"Compiled {len(jobs)} translation units in {elapsed_ms:.0f}ms"
+        )
+
+        return self._link()
+
+    def _newest_header_mtime(self) -> float:
+        """
+        Get the newest mtime among the build directory's headers.
+
+        Every translation unit includes the shared headers (tdef.h and
+        friends), so their newest mtime acts as a floor on each output
+        comparison: one stat per header covers the whole include fan-out.
+
+        Returns:
+            Newest header mtime, or 0.0 when there are no headers
+        """
+        newest = 0.0
+        with os.scandir(self.build_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".h"):
+                    try:
+                        newest = max(newest, entry.stat().st_mtime)
+                    except OSError:
+                        continue
+        return newest
+
+    def _is_up_to_date(
+        self, output_path: str, input_path: str, floor_mtime: float = 0.0
+    ) -> bool:
+        """
+        Check whether an output file is at least as new as its input.
+
+        Args:
+            output_path: Path of the generated file
+            input_path: Path of the file it was generated from
+            floor_mtime: Extra mtime the output must also be newer than
+                (used for shared headers included by every input)
+
+        Returns:
+            True if the output exists and is not older than the input
+        """
+        try:
+            output_mtime = os.stat(output_path).st_mtime
+            return (
+                output_mtime >= os.stat(input_path).st_mtime
+                and output_mtime >= floor_mtime
+            )
+        except FileNotFoundError:
+            return False
+
+    def _link(self) -> bool:
+        """
+        Link all object files into the final executable.
+
+        Returns:
+            True if linking succeeds, False otherwise
+        """
+        link_command = [_resolve_tool(self.compiler) or self.compiler]
+        link_command += self.compile_flags
+        link_command.extend(
+            source_file.replace(".c", ".o") for source_file in self.source_files
+        )
+        link_command.extend(self.object_files)
+        link_command.extend(["-o", self.output_executable])
+
+        success, output = self.run_command(link_command, "Linking NROFF")
+
         return success
     
     def strip_executable(self) -> bool:
@@ -238,51 +530,23 @@ class NroffBuilder:
         if not self.strip_symbols:
             self.logger.info("Skipping symbol stripping (disabled).")
             return True
-        
-        # Check if a.out exists
-        temp_executable = self.build_dir / "a.out"
-        if not temp_executable.exists():
-            self.logger.error("Temporary executable 'a.out' not found.")
+
+        # Check that the linker produced the executable
+        try:
+            os.stat(self._exe_path)
+        except FileNotFoundError:
+            self.logger.error(f"Executable {self.output_executable} not found.")
             return False
-        
+
         # Strip symbols
-        strip_command = ["strip", "a.out"]
+        strip_command = [_resolve_tool("strip") or "strip", self.output_executable]
         success, output = self.run_command(
             strip_command,
             "Stripping debugging symbols"
         )
-        
+
         return success
-    
-    def rename_executable(self) -> bool:
-        """
-        Rename the temporary executable to the final name.
-        
-        Returns:
-            True if renaming succeeds, False otherwise
-        """
-        temp_executable = self.build_dir / "a.out"
-        final_executable = self.build_dir / self.output_executable
-        
-        if not temp_executable.exists():
-            self.logger.error("Temporary executable 'a.out' not found.")
-            return False
-        
-        try:
-            # Remove existing executable if it exists
-            if final_executable.exists():
-                final_executable.unlink()
-                self.logger.debug(f"Removed existing {self.output_executable}")
-            
-            # Rename a.out to nroff
-            temp_executable.rename(final_executable)
-            self.logger.info(f"Created executable: {final_executable}")
-            return True
-            
-        except OSError as e:
-            self.logger.error(f"Failed to rename executable: {e}")
-            return False
-    
+
     def validate_build(self) -> bool:
         """
         Validate that the build was successful.
@@ -290,34 +554,23 @@ class NroffBuilder:
         Returns:
             True if validation passes, False otherwise
         """
-        executable_path = self.build_dir / self.output_executable
-        
-        if not executable_path.exists():
+        executable_path = self._exe_path
+
+        if not os.path.exists(executable_path):
             self.logger.error(f"Executable {self.output_executable} not found.")
             return False
-        
+
         # Check if file is executable
         if not os.access(executable_path, os.X_OK):
             self.logger.error(f"File {self.output_executable} is not executable.")
             return False
-        
+
         # Get file size
-        file_size = executable_path.stat().st_size
+        file_size = os.stat(executable_path).st_size
         self.logger.info(f"Built executable: {executable_path} ({file_size} bytes)")
-        
-        # Optional: Test execution (just check if it starts)
-        try:
-            result = subprocess.run(
-                [str(executable_path), "--help"],
-                capture_output=True,
-                timeout=5,
-                cwd=self.build_dir
-            )
-            # Note: Many programs return non-zero for --help, so we don't check return code
-            self.logger.debug("Executable appears to run correctly.")
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            self.logger.warning("Could not validate executable functionality.")
-        
+
+        # The access and size checks above are sufficient; historic nroff
+        # has no --help and may block reading stdin, so no smoke test.
         return True
     
     def clean_build(self) -> bool:
@@ -330,16 +583,15 @@ class NroffBuilder:
         self.logger.info("Cleaning build artifacts...")
         
         artifacts = ["a.out", self.output_executable]
-        
+
         for artifact in artifacts:
-            artifact_path = self.build_dir / artifact
-            if artifact_path.exists():
-                try:
-                    artifact_path.unlink()
+            artifact_path = os.path.join(str(self.build_dir), artifact)
+            try:
+                if _rm_f(artifact_path):
                     self.logger.info(f"Removed {artifact}")
-                except OSError as e:
-                    self.logger.error(f"Failed to remove {artifact}: {e}")
-                    return False
+            except OSError as e:
+                self.logger.error(f"Failed to remove {artifact}: {e}")
+                return False
         
         self.logger.info("Build artifacts cleaned.")
         return True
@@ -354,16 +606,15 @@ class NroffBuilder:
         if not self.backup_existing:
             return True
             
-        executable_path = self.build_dir / self.output_executable
-        if not executable_path.exists():
+        executable_path = self._exe_path
+        if not os.path.exists(executable_path):
             return True  # No existing executable to backup
-            
-        backup_path = self.build_dir / f"{self.output_executable}.backup"
-        
+
+        backup_path = f"{self._exe_path}.backup"
+
         try:
-            if backup_path.exists():
-                backup_path.unlink()
-            executable_path.rename(backup_path)
+            # os.replace overwrites the destination atomically in one syscall
+            os.replace(executable_path, backup_path)
             self.logger.info(f"Created backup: {backup_path}")
             return True
         except OSError as e:
@@ -373,7 +624,12 @@ class NroffBuilder:
     def get_build_info(self) -> dict:
         """
         Get information about the build environment.
-        
+
+        This is the only place that probes the compiler version, and it
+        must stay off the default build path: call it from the --info
+        CLI branch only, never from build() or check_dependencies(),
+        so a plain build spawns no version probes.
+
         Returns:
             Dictionary containing build environment information
         """
@@ -387,17 +643,11 @@ class NroffBuilder:
             "strip_symbols": self.strip_symbols
         }
         
-        # Add compiler version if available
-        try:
-            result = subprocess.run(
-                [self.compiler, "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                info["compiler_version"] = result.stdout.strip().split('\n')[0]
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        # Add compiler version if available (cached across the process)
+        returncode, version_line = _probe_tool(self.compiler)
+        if returncode == 0:
+            info["compiler_version"] = version_line
+        else:
             info["compiler_version"] = "Unknown"
         
         return info
@@ -410,7 +660,21 @@ class NroffBuilder:
             True if build succeeds, False otherwise
         """
         self.logger.info("Starting NROFF build process...")
-        
+
+        # Short-circuit when the executable is newer than every input,
+        # headers included; this must run before the backup step moves
+        # the executable away.
+        header_mtime = self._newest_header_mtime()
+        inputs = self._src_paths + self._tu_obj_paths + self._obj_paths
+        if all(
+            self._is_up_to_date(self._exe_path, p, header_mtime)
+            for p in inputs
+        ):
+            self.logger.info(
+                f"{self.output_executable} is up to date; nothing to do."
+            )
+            return True
+
         # Backup existing executable if requested
         if not self.backup_existing_executable():
             return False
@@ -426,11 +690,7 @@ class NroffBuilder:
         # Strip symbols
         if not self.strip_executable():
             return False
-        
-        # Rename executable
-        if not self.rename_executable():
-            return False
-        
+
         # Validate build
         if not self.validate_build():
             return False
@@ -485,6 +745,16 @@ Examples:
 
     parser.add_argument("--flags", nargs="*", help="Additional compiler flags")
 
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        help=(
+            "Number of parallel compile jobs "
+            "(default: NROFF_NUM_BUILD_JOBS or CPU count)"
+        ),
+    )
+
     parser.add_argument(
         "--info",
         action="store_true",
@@ -526,6 +796,9 @@ Examples:
     if hasattr(args, "flags") and args.flags:
         builder.compile_flags.extend(args.flags)
 
+    if args.jobs:
+        builder.jobs = max(1, args.jobs)
+
     if hasattr(args, "no_backup") and args.no_backup:
         builder.backup_existing = False
 
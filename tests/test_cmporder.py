@@ -2,32 +2,26 @@
 
 from __future__ import annotations
 
+import io
 import random
 import subprocess
 import sys
 from pathlib import Path
 
+import tools.cmporder as cmporder
+from tools.cmporder import sort_lines
 
-def run_cmporder(input_lines: list[str]) -> list[str]:
-    """Run cmporder with the given input lines and return output lines."""
 
-    # Path to the cmporder executable script.
-    cmporder_path = Path(__file__).resolve().parents[1] / "tools" / "cmporder.py"
+def run_cmporder(input_lines: list[str]) -> list[str]:
+    """Sort the given input lines in-process and return output lines."""
 
     # Create a single string from the input lines and append a newline
     # only when input is non-empty.
     joined = "\n".join(input_lines) + ("\n" if input_lines else "")
 
-    # Execute the cmporder script using the current Python interpreter.
-    result = subprocess.run(
-        [sys.executable, str(cmporder_path)],
-        input=joined.encode(),
-        capture_output=True,
-        check=True,
-    )
-
-    # Split the output back into separate lines.
-    return result.stdout.decode().splitlines()
+    # Calling sort_lines directly avoids spawning a fresh interpreter
+    # per test; the CLI contract is covered by test_cli_sorts_stdin.
+    return sort_lines(joined).splitlines()
 
 
 def test_unsorted_input_sorted_output() -> None:
@@ -66,3 +60,38 @@ def test_sorted_input_unchanged() -> None:
 def test_empty_input_returns_empty_list() -> None:
     """Verify cmporder returns an empty list for empty input."""
     assert run_cmporder([]) == []
+
+
+def test_cli_sorts_stdin() -> None:
+    """End-to-end check that the script sorts stdin via the CLI."""
+
+    # Path to the cmporder executable script.
+    cmporder_path = Path(__file__).resolve().parents[1] / "tools" / "cmporder.py"
+
+    # Execute the cmporder script using the current Python interpreter.
+    result = subprocess.run(
+        [sys.executable, str(cmporder_path)],
+        input=b"b\na\nc\n",
+        capture_output=True,
+        check=True,
+    )
+
+    assert result.stdout.decode().splitlines() == ["a", "b", "c"]
+
+
+def test_external_sort_matches_in_memory(monkeypatch) -> None:
+    """Verify the spill path orders lines exactly like the in-memory sort."""
+
+    # Tiny chunks force many spill files from a small input.
+    monkeypatch.setattr(cmporder, "_CHUNK_SIZE", 8)
+
+    # Includes a tab line that sorts before its prefix's newline byte,
+    # which is exactly where terminator-inclusive ordering diverges.
+    lines = [b"foo", b"foo\tbar", b"b", b"a", b"ab", b"b\x01c", b"", b"zz"]
+    data = b"".join(line + b"\n" for line in lines)
+
+    out = io.BytesIO()
+    cmporder._external_sort(data, out)
+
+    expected = b"".join(line + b"\n" for line in sorted(lines))
+    assert out.getvalue() == expected
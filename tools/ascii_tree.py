@@ -5,29 +5,60 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, List
 
+SKIP = frozenset({".git", "__pycache__", "build", "obj"})
 
-def _walk(dir_path: Path, prefix: str = "") -> Iterable[str]:
-    """Yield lines of an ASCII tree for the given directory."""
-    entries = [
-        p
-        for p in dir_path.iterdir()
-        if p.name not in {".git", "__pycache__", "build", "obj"}
-    ]
-    entries.sort(key=lambda p: p.name)
-    for index, entry in enumerate(entries):
-        connector = "└── " if index == len(entries) - 1 else "├── "
-        yield f"{prefix}{connector}{entry.name}"
-        if entry.is_dir():
-            extension = "    " if index == len(entries) - 1 else "│   "
-            yield from _walk(entry, prefix + extension)
+
+def _list_entries(path: str) -> List[os.DirEntry]:
+    """Return the sorted, filtered directory entries for a path."""
+    with os.scandir(path) as it:
+        return sorted(
+            (entry for entry in it if entry.name not in SKIP),
+            key=lambda entry: entry.name,
+        )
+
+
+def _walk(dir_path: str) -> Iterable[str]:
+    """Yield lines of an ASCII tree for the given directory.
+
+    The traversal uses an explicit stack over ``os.scandir`` entries:
+    no recursion, no per-entry ``Path`` allocation, and ``is_dir`` is
+    answered from the cached dirent without an extra stat call.  Only
+    directories with entries still pending are kept on the stack, so
+    peak memory is bounded by depth times fanout rather than the total
+    entry count.
+    """
+    entries = _list_entries(os.fspath(dir_path))
+    index = 0
+    prefix = ""
+    stack: List[tuple] = []
+    while True:
+        if index < len(entries):
+            entry = entries[index]
+            index += 1
+            last = index == len(entries)
+            connector = "└── " if last else "├── "
+            yield f"{prefix}{connector}{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                if not last:
+                    # Resume this directory after the subtree is emitted.
+                    stack.append((entries, index, prefix))
+                # Exhausted frames are never pushed, so their dirent
+                # lists are freed before the subtree below is walked.
+                extension = "    " if last else "│   "
+                entries, index = _list_entries(entry.path), 0
+                prefix = prefix + extension
+        elif stack:
+            entries, index, prefix = stack.pop()
+        else:
+            return
 
 
 def main() -> int:
     """Entry point for script."""
     root = Path(__file__).resolve().parents[1]
-    for line in _walk(root):
+    for line in _walk(str(root)):
         print(line)
     return 0
 